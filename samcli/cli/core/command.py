@@ -4,7 +4,7 @@ to be specific for AWS SAM CLI.
 
 Should be used by all commands for a consistent UI experience
 """
-from typing import Dict, List
+from typing import List, Mapping
 
 from click import Command, Context, Parameter, style
 
@@ -39,7 +39,7 @@ class CoreCommand(Command):
         ctx: Context,
         params: List[Parameter],
         formatter: RootCommandHelpTextFormatter,
-        formatting_options: Dict[str, Dict],
+        formatting_options: Mapping[str, Mapping],
     ):
         for option_heading, options in formatting_options.items():
             opts: List[RowDefinition] = sorted(
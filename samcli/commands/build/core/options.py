@@ -1,18 +1,20 @@
 """
 Build Command Options related Datastructures for formatting.
 """
-from typing import Dict, List
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple
 
 from samcli.cli.row_modifiers import RowDefinition
 
 # NOTE(sriram-mv): The ordering of the option lists matter, they are the order
 # in which options will be displayed.
 
-REQUIRED_OPTIONS: List[str] = ["template_file"]
+REQUIRED_OPTIONS: Tuple[str, ...] = ("template_file",)
 
-AWS_CREDENTIAL_OPTION_NAMES: List[str] = ["region", "profile"]
+AWS_CREDENTIAL_OPTION_NAMES: Tuple[str, ...] = ("region", "profile")
 
-CONTAINER_OPTION_NAMES: List[str] = [
+CONTAINER_OPTION_NAMES: Tuple[str, ...] = (
     "use_container",
     "container_env_var",
     "container_env_var_file",
@@ -20,62 +22,65 @@ CONTAINER_OPTION_NAMES: List[str] = [
     "mount_with",
     "skip_pull_image",
     "docker_network",
-]
+)
 
-CONFIGURATION_OPTION_NAMES: List[str] = ["config_env", "config_file"]
+CONFIGURATION_OPTION_NAMES: Tuple[str, ...] = ("config_env", "config_file")
 
-EXTENSION_OPTIONS: List[str] = ["hook_name", "skip_prepare_infra"]
+EXTENSION_OPTIONS: Tuple[str, ...] = ("hook_name", "skip_prepare_infra")
 
-BUILD_STRATEGY_OPTIONS: List[str] = ["parallel", "exclude", "manifest", "cached"]
+BUILD_STRATEGY_OPTIONS: Tuple[str, ...] = ("parallel", "exclude", "manifest", "cached")
 
-ARTIFACT_LOCATION_OPTIONS: List[str] = [
+ARTIFACT_LOCATION_OPTIONS: Tuple[str, ...] = (
     "build_dir",
     "cache_dir",
     "base_dir",
-]
+)
 
-TEMPLATE_OPTIONS: List[str] = ["parameter_overrides"]
+TEMPLATE_OPTIONS: Tuple[str, ...] = ("parameter_overrides",)
 
-BETA_OPTIONS: List[str] = ["beta_features"]
+BETA_OPTIONS: Tuple[str, ...] = ("beta_features",)
 
 
-OTHER_OPTIONS: List[str] = ["debug", "help"]
+OTHER_OPTIONS: Tuple[str, ...] = ("debug", "help")
 
-ALL_OPTIONS: List[str] = (
-    REQUIRED_OPTIONS
-    + TEMPLATE_OPTIONS
-    + AWS_CREDENTIAL_OPTION_NAMES
-    + BUILD_STRATEGY_OPTIONS
-    + CONTAINER_OPTION_NAMES
-    + ARTIFACT_LOCATION_OPTIONS
-    + EXTENSION_OPTIONS
-    + CONFIGURATION_OPTION_NAMES
-    + BETA_OPTIONS
-    + OTHER_OPTIONS
+# Section titles paired with their option groups, in display order.
+_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Required Options", REQUIRED_OPTIONS),
+    ("Template Options", TEMPLATE_OPTIONS),
+    ("AWS Credential Options", AWS_CREDENTIAL_OPTION_NAMES),
+    ("Build Strategy Options", BUILD_STRATEGY_OPTIONS),
+    ("Container Options", CONTAINER_OPTION_NAMES),
+    ("Artifact Location Options", ARTIFACT_LOCATION_OPTIONS),
+    ("Extension Options", EXTENSION_OPTIONS),
+    ("Configuration Options", CONFIGURATION_OPTION_NAMES),
+    ("Beta Options", BETA_OPTIONS),
+    ("Other Options", OTHER_OPTIONS),
 )
 
-OPTIONS_INFO: Dict[str, Dict] = {
-    "Required Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(REQUIRED_OPTIONS)}},
-    "Template Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(TEMPLATE_OPTIONS)}},
-    "AWS Credential Options": {
-        "option_names": {opt: {"rank": idx} for idx, opt in enumerate(AWS_CREDENTIAL_OPTION_NAMES)}
-    },
-    "Build Strategy Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(BUILD_STRATEGY_OPTIONS)}},
-    "Container Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(CONTAINER_OPTION_NAMES)}},
-    "Artifact Location Options": {
-        "option_names": {opt: {"rank": idx} for idx, opt in enumerate(ARTIFACT_LOCATION_OPTIONS)}
-    },
-    "Extension Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(EXTENSION_OPTIONS)}},
+# Additional section entries, keyed by section title.
+_EXTRAS: Dict[str, Dict] = {
     "Configuration Options": {
-        "option_names": {opt: {"rank": idx} for idx, opt in enumerate(CONFIGURATION_OPTION_NAMES)},
-        "extras": [
+        "extras": (
             RowDefinition(name="Learn more about configuration files at:"),
             RowDefinition(
                 name="https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/serverless-sam-cli"
                 "-config.html. "
             ),
-        ],
+        ),
     },
-    "Beta Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(BETA_OPTIONS)}},
-    "Other Options": {"option_names": {opt: {"rank": idx} for idx, opt in enumerate(OTHER_OPTIONS)}},
 }
+
+
+def _ranked(names: Iterable[str]) -> Dict[str, Dict[str, int]]:
+    return {name: {"rank": idx} for idx, name in enumerate(names)}
+
+
+ALL_OPTIONS: Tuple[str, ...] = tuple(chain.from_iterable(group for _, group in _GROUPS))
+
+# Set for membership checks; ALL_OPTIONS keeps the display order.
+ALL_OPTIONS_SET: FrozenSet[str] = frozenset(ALL_OPTIONS)
+
+# NOTE: OPTIONS_INFO is a read-only view, consumers that need to modify it must make their own copy.
+OPTIONS_INFO: Mapping[str, Mapping] = MappingProxyType(
+    {title: MappingProxyType({"option_names": _ranked(group), **_EXTRAS.get(title, {})}) for title, group in _GROUPS}
+)
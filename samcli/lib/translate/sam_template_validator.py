@@ -1,9 +1,10 @@
 """
 Library for Validating Sam Templates
 """
-import functools
 import logging
-from typing import Dict, cast
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, cast
 
 from boto3.session import Session
 from samtranslator.parser import parser
@@ -13,14 +14,43 @@ from samtranslator.translator.translator import Translator
 
 from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
 from samcli.lib.utils.packagetype import IMAGE, ZIP
-from samcli.lib.utils.resources import AWS_SERVERLESS_FUNCTION
+from samcli.lib.utils.resources import (
+    AWS_SERVERLESS_API,
+    AWS_SERVERLESS_FUNCTION,
+    AWS_SERVERLESS_HTTPAPI,
+    AWS_SERVERLESS_LAYERVERSION,
+    AWS_SERVERLESS_STATEMACHINE,
+)
 from samcli.yamlhelper import yaml_dump
 
 LOG = logging.getLogger(__name__)
 
+# Resource type -> (uri property, whether it is only replaced when already present).
+# DefinitionUri is optional since those resources can define their body inline instead.
+_URI_FIELDS: Dict[str, Tuple[str, bool]] = {
+    AWS_SERVERLESS_LAYERVERSION: ("ContentUri", False),
+    AWS_SERVERLESS_API: ("DefinitionUri", True),
+    AWS_SERVERLESS_HTTPAPI: ("DefinitionUri", True),
+    AWS_SERVERLESS_STATEMACHINE: ("DefinitionUri", True),
+}
+
+# Shared read-only fallback for missing Properties/Metadata, avoids allocating an empty dict per resource
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _is_s3_uri(uri) -> bool:
+    return isinstance(uri, str) and uri.startswith("s3://")
+
 
 class SamTemplateValidator:
-    def __init__(self, sam_template, managed_policy_loader: ManagedPolicyLoader, profile=None, region=None):
+    def __init__(
+        self,
+        sam_template,
+        managed_policy_loader: ManagedPolicyLoader,
+        profile=None,
+        region=None,
+        boto3_session: Optional[Session] = None,
+    ):
         """
         Construct a SamTemplateValidator
 
@@ -40,11 +70,39 @@ class SamTemplateValidator:
             Dictionary representing a SAM Template
         managed_policy_loader ManagedPolicyLoader
             Sam ManagedPolicyLoader
+        profile str, optional
+            AWS profile used to create the boto3 Session when none is given
+        region str, optional
+            AWS region used to create the boto3 Session when none is given
+        boto3_session Session, optional
+            Existing boto3 Session to reuse, e.g. when validating several templates in one invocation
         """
         self.sam_template = sam_template
         self.managed_policy_loader = managed_policy_loader
-        self.sam_parser = parser.Parser()
-        self.boto3_session = Session(profile_name=profile, region_name=region)
+        self._profile = profile
+        self._region = region
+        self._sam_parser: Optional[parser.Parser] = None
+        self._boto3_session: Optional[Session] = boto3_session
+        self._policy_map: Optional[Dict[str, str]] = None
+
+    @property
+    def sam_parser(self) -> parser.Parser:
+        """
+        SAM Parser used by the translator, created on first use
+        """
+        if self._sam_parser is None:
+            self._sam_parser = parser.Parser()
+        return self._sam_parser
+
+    @property
+    def boto3_session(self) -> Session:
+        """
+        boto3 Session used by the translator, created on first use since building a Session
+        loads botocore's data files from disk
+        """
+        if self._boto3_session is None:
+            self._boto3_session = Session(profile_name=self._profile, region_name=self._region)
+        return self._boto3_session
 
     def get_translated_template_if_valid(self):
         """
@@ -65,31 +123,34 @@ class SamTemplateValidator:
         )
 
         self._replace_local_codeuri()
-        self._replace_local_image()
 
         try:
             template = sam_translator.translate(
                 sam_template=self.sam_template, parameter_values={}, get_managed_policy_map=self._get_managed_policy_map
             )
-            LOG.debug("Translated template is:\n%s", yaml_dump(template))
-            return yaml_dump(template)
+            translated_template = yaml_dump(template)
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Translated template is:\n%s", translated_template)
+            return translated_template
         except InvalidDocumentException as e:
-            raise InvalidSamDocumentException(
-                functools.reduce(lambda message, error: message + " " + str(error), e.causes, str(e))
-            ) from e
+            raise InvalidSamDocumentException(" ".join([str(e), *(str(cause) for cause in e.causes)])) from e
 
-    @functools.lru_cache(maxsize=None)
     def _get_managed_policy_map(self) -> Dict[str, str]:
         """
         Helper function for getting managed policies and caching them.
         Used by the transform for loading policies.
 
+        The policy map is cached on the instance rather than through ``functools.lru_cache``,
+        which would keep every validator alive for the lifetime of the process.
+
         Returns
         -------
         Dict[str, str]
             Dictionary containing the policy map
         """
-        return cast(Dict[str, str], self.managed_policy_loader.load())
+        if self._policy_map is None:
+            self._policy_map = cast(Dict[str, str], self.managed_policy_loader.load())
+        return self._policy_map
 
     def _replace_local_codeuri(self):
         """
@@ -97,60 +158,74 @@ class SamTemplateValidator:
         AWS::Serverless::HttpApi to a fake S3 Uri. This is to support running the SAM Translator with
         valid values for these fields. If this in not done, the template is invalid in the eyes of SAM
         Translator (the translator does not support local paths)
+
+        Image based functions that reference a local image are handled in the same pass over the
+        resources, see `_replace_local_image`.
         """
 
         all_resources = self.sam_template.get("Resources", {})
         global_settings = self.sam_template.get("Globals", {})
 
-        for resource_type, properties in global_settings.items():
-            if resource_type == "Function":
-                if all(
-                    [
-                        _properties.get("Properties", {}).get("PackageType", ZIP) == ZIP
-                        for _, _properties in all_resources.items()
-                    ]
-                    + [_properties.get("PackageType", ZIP) == ZIP for _, _properties in global_settings.items()]
-                ):
-                    SamTemplateValidator._update_to_s3_uri("CodeUri", properties)
+        func_globals = global_settings.get("Function")
+        if func_globals is not None:
+            package_types = chain(
+                (
+                    (_properties.get("Properties") or _EMPTY).get("PackageType", ZIP)
+                    for _properties in all_resources.values()
+                ),
+                (_properties.get("PackageType", ZIP) for _properties in global_settings.values()),
+            )
+            # Globals can only carry a fake CodeUri when nothing in the template uses a non Zip PackageType
+            if all(package_type == ZIP for package_type in package_types):
+                SamTemplateValidator._update_to_s3_uri("CodeUri", func_globals)
 
         for _, resource in all_resources.items():
             resource_type = resource.get("Type")
-            resource_dict = resource.get("Properties", {})
+            # malformed types (e.g. a mapping) are left for the translator to report
+            if not isinstance(resource_type, str):
+                continue
+
+            resource_dict = resource.get("Properties")
+            # every resource handled below needs Properties to hold its uri
+            if resource_dict is None:
+                continue
+
+            # NOTE: resource types come from the YAML/JSON parsers and are not interned, so this has to stay an
+            # equality check. str equality already short-circuits on identity before comparing contents.
+            if resource_type == AWS_SERVERLESS_FUNCTION:
+                if resource_dict.get("PackageType", ZIP) == ZIP:
+                    SamTemplateValidator._update_to_s3_uri("CodeUri", resource_dict)
+                else:
+                    SamTemplateValidator._replace_local_image(resource, resource_dict)
+                continue
+
+            uri_field = _URI_FIELDS.get(resource_type)
+            if uri_field is None:
+                continue
+
+            property_key, only_if_present = uri_field
+            if not only_if_present or property_key in resource_dict:
+                SamTemplateValidator._update_to_s3_uri(property_key, resource_dict)
 
-            if resource_type == "AWS::Serverless::Function" and resource_dict.get("PackageType", ZIP) == ZIP:
-                SamTemplateValidator._update_to_s3_uri("CodeUri", resource_dict)
-
-            if resource_type == "AWS::Serverless::LayerVersion":
-                SamTemplateValidator._update_to_s3_uri("ContentUri", resource_dict)
-
-            if resource_type == "AWS::Serverless::Api":
-                if "DefinitionUri" in resource_dict:
-                    SamTemplateValidator._update_to_s3_uri("DefinitionUri", resource_dict)
-
-            if resource_type == "AWS::Serverless::HttpApi":
-                if "DefinitionUri" in resource_dict:
-                    SamTemplateValidator._update_to_s3_uri("DefinitionUri", resource_dict)
-
-            if resource_type == "AWS::Serverless::StateMachine":
-                if "DefinitionUri" in resource_dict:
-                    SamTemplateValidator._update_to_s3_uri("DefinitionUri", resource_dict)
-
-    def _replace_local_image(self):
+    @staticmethod
+    def _replace_local_image(resource, properties):
         """
-        Adds fake ImageUri to AWS::Serverless::Functions that reference a local image using Metadata.
+        Adds fake ImageUri to an AWS::Serverless::Function that references a local image using Metadata.
         This ensures sam validate works without having to package the app or use ImageUri.
-        """
-        resources = self.sam_template.get("Resources", {})
-        for _, resource in resources.items():
-            resource_type = resource.get("Type")
-            properties = resource.get("Properties", {})
 
-            is_image_function = resource_type == AWS_SERVERLESS_FUNCTION and properties.get("PackageType") == IMAGE
-            is_local_image = resource.get("Metadata", {}).get("Dockerfile")
+        Parameters
+        ----------
+        resource dict, required
+            AWS::Serverless::Function resource in the template
+        properties dict, required
+            Properties of the resource, mutated in place
+        """
+        is_image_function = properties.get("PackageType") == IMAGE
+        is_local_image = (resource.get("Metadata") or _EMPTY).get("Dockerfile")
 
-            if is_image_function and is_local_image:
-                if "ImageUri" not in properties:
-                    properties["ImageUri"] = "111111111111.dkr.ecr.region.amazonaws.com/repository"
+        if is_image_function and is_local_image:
+            if "ImageUri" not in properties:
+                properties["ImageUri"] = "111111111111.dkr.ecr.region.amazonaws.com/repository"
 
     @staticmethod
     def is_s3_uri(uri):
@@ -168,7 +243,7 @@ class SamTemplateValidator:
             Returns True if the uri given is an S3 uri, otherwise False
 
         """
-        return isinstance(uri, str) and uri.startswith("s3://")
+        return _is_s3_uri(uri)
 
     @staticmethod
     def _update_to_s3_uri(property_key, resource_property_dict, s3_uri_value="s3://bucket/value"):
@@ -186,10 +261,13 @@ class SamTemplateValidator:
         s3_uri_value str, optional
             Value to update the value of the property_key to
         """
-        uri_property = resource_property_dict.get(property_key, ".")
+        uri_property = resource_property_dict.get(property_key)
 
         # ignore if dict or already an S3 Uri
-        if isinstance(uri_property, dict) or SamTemplateValidator.is_s3_uri(uri_property):
+        if isinstance(uri_property, str):
+            if uri_property.startswith("s3://"):
+                return
+        elif isinstance(uri_property, dict):
             return
 
         resource_property_dict[property_key] = s3_uri_value
@@ -25,6 +25,14 @@ from botocore.compat import OrderedDict
 from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
 from yaml.nodes import ScalarNode, SequenceNode
 
+# Prefer the libyaml backed dumper, which is several times faster than the pure Python implementation.
+# PyYAML only provides it when it was built against libyaml. Parsing intentionally keeps the pure Python
+# SafeLoader, as the libyaml parser reports template syntax errors without the source excerpt and caret.
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _BaseDumper  # type: ignore
+
 TAG_STR = "tag:yaml.org,2002:str"
 TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
 
@@ -45,6 +53,8 @@ def string_representer(dumper, value):
     -------
 
     """
+    # The libyaml emitter only accepts exact str scalars, not subclasses such as Py27UniStr
+    value = str(value)
     if value.startswith("0"):
         return dumper.represent_scalar(TAG_STR, value, style="'")
 
@@ -151,6 +161,6 @@ def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
         return yaml_parse(content)
 
 
-class CfnDumper(yaml.SafeDumper):
+class CfnDumper(_BaseDumper):
     def ignore_aliases(self, data):
         return True
@@ -0,0 +1,13 @@
+from unittest import TestCase
+
+from samcli.commands.build.core.options import ALL_OPTIONS, ALL_OPTIONS_SET, OPTIONS_INFO
+
+
+class TestOptions(TestCase):
+    def test_all_options_set_matches_all_options(self):
+        self.assertEqual(len(ALL_OPTIONS), len(ALL_OPTIONS_SET))
+        self.assertEqual(ALL_OPTIONS_SET, frozenset(ALL_OPTIONS))
+
+    def test_options_info_covers_all_options(self):
+        option_names = [name for section in OPTIONS_INFO.values() for name in section["option_names"]]
+        self.assertEqual(option_names, list(ALL_OPTIONS))
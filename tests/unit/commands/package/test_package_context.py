@@ -1,6 +1,7 @@
 """Test sam package command"""
+import os
 from unittest import TestCase
-from unittest.mock import patch, MagicMock, Mock, call, ANY
+from unittest.mock import patch, Mock, call, ANY
 from parameterized import parameterized
 import tempfile
 
@@ -15,8 +16,27 @@ from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_SERVERLESS_FUNCT
 
 class TestPackageCommand(TestCase):
     def setUp(self):
-        self.package_command_context = PackageContext(
-            template_file="template-file",
+        # Shared by every test, started per test so each one gets fresh mocks
+        normalize_patch = patch.object(ResourceMetadataNormalizer, "normalize")
+        self.patched_normalize = normalize_patch.start()
+        self.addCleanup(normalize_patch.stop)
+        export_patch = patch.object(Template, "export", return_value={})
+        self.patched_export = export_patch.start()
+        self.addCleanup(export_patch.stop)
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.template_file = os.path.join(self._tmpdir.name, "template")
+        self.output_template_file = os.path.join(self._tmpdir.name, "output-template")
+        open(self.template_file, "w").close()
+
+        self.package_command_context = self._make_ctx()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _make_ctx(self, **kwargs):
+        ctx_kwargs = dict(
+            template_file=self.template_file,
             s3_bucket="s3-bucket",
             s3_prefix="s3-prefix",
             image_repository="image-repo",
@@ -30,87 +50,39 @@ class TestPackageCommand(TestCase):
             region=None,
             profile=None,
         )
+        ctx_kwargs.update(kwargs)
+        return PackageContext(**ctx_kwargs)
 
     @patch.object(SamLocalStackProvider, "get_stacks")
-    @patch.object(Template, "export", MagicMock(sideeffect=OSError))
     @patch("boto3.client")
     def test_template_permissions_error(self, patched_boto, patched_get_stacks):
         patched_get_stacks.return_value = Mock(), Mock()
-        with self.assertRaises(PackageFailedError):
-            with patch.object(self.package_command_context, "_warn_preview_runtime") as patched_warn_preview_runtime:
-                self.package_command_context.run()
+        with patch.object(Template, "export", side_effect=OSError) as patched_export:
+            with self.assertRaises(PackageFailedError):
+                with patch.object(self.package_command_context, "_warn_preview_runtime"):
+                    self.package_command_context.run()
 
-    @patch.object(ResourceMetadataNormalizer, "normalize", MagicMock())
-    @patch.object(Template, "export", MagicMock(return_value={}))
-    @patch("boto3.client")
-    def test_template_path_valid_with_output_template(self, patched_boto):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_template_file:
-            with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_output_template_file:
-                package_command_context = PackageContext(
-                    template_file=temp_template_file.name,
-                    s3_bucket="s3-bucket",
-                    s3_prefix="s3-prefix",
-                    image_repository="image-repo",
-                    image_repositories=None,
-                    kms_key_id="kms-key-id",
-                    output_template_file=temp_output_template_file.name,
-                    use_json=True,
-                    force_upload=True,
-                    no_progressbar=False,
-                    metadata={},
-                    region="us-east-2",
-                    profile=None,
-                )
-                package_command_context.run()
-
-    @patch.object(ResourceMetadataNormalizer, "normalize", MagicMock())
-    @patch.object(Template, "export", MagicMock(return_value={}))
-    @patch("boto3.client")
-    def test_template_path_valid(self, patched_boto):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_template_file:
-            package_command_context = PackageContext(
-                template_file=temp_template_file.name,
-                s3_bucket="s3-bucket",
-                s3_prefix="s3-prefix",
-                image_repository="image-repo",
-                image_repositories=None,
-                kms_key_id="kms-key-id",
-                output_template_file=None,
-                use_json=True,
-                force_upload=True,
-                no_progressbar=False,
-                metadata={},
-                region=None,
-                profile=None,
-            )
-            package_command_context.run()
+        patched_export.assert_called_once_with()
 
-    @patch.object(ResourceMetadataNormalizer, "normalize", MagicMock())
-    @patch.object(Template, "export", MagicMock(return_value={}))
+    @parameterized.expand(
+        [
+            (False, True, None),
+            (True, True, "us-east-2"),
+            (False, False, None),
+        ]
+    )
     @patch("boto3.client")
-    def test_template_path_valid_no_json(self, patched_boto):
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_template_file:
-            package_command_context = PackageContext(
-                template_file=temp_template_file.name,
-                s3_bucket="s3-bucket",
-                s3_prefix="s3-prefix",
-                image_repository="image-repo",
-                image_repositories=None,
-                kms_key_id="kms-key-id",
-                output_template_file=None,
-                use_json=False,
-                force_upload=True,
-                no_progressbar=False,
-                metadata={},
-                region=None,
-                profile=None,
-            )
-            package_command_context.run()
+    def test_template_path_valid(self, with_output_template, use_json, region, patched_boto):
+        package_command_context = self._make_ctx(
+            output_template_file=self.output_template_file if with_output_template else None,
+            use_json=use_json,
+            region=region,
+        )
+        package_command_context.run()
 
     @patch("samcli.commands.package.package_context.PackageContext._warn_preview_runtime")
     @patch("samcli.commands.package.package_context.get_resource_full_path_by_id")
     @patch.object(SamLocalStackProvider, "get_stacks")
-    @patch.object(Template, "export", MagicMock(return_value={}))
     @patch("boto3.Session")
     @patch("boto3.client")
     @patch("samcli.commands.package.package_context.get_boto_config_with_user_agent")
@@ -43,6 +43,21 @@ class TestSamTemplateValidator(TestCase):
         )
         sam_parser.Parser.assert_called_once()
 
+    @patch("samcli.lib.translate.sam_template_validator.yaml_dump")
+    @patch("samcli.lib.translate.sam_template_validator.Session")
+    @patch("samcli.lib.translate.sam_template_validator.Translator")
+    @patch("samcli.lib.translate.sam_template_validator.parser")
+    def test_translated_template_dumped_once(self, sam_parser, sam_translator, boto_session_patch, yaml_dump_patch):
+        translate_mock = Mock()
+        translate_mock.translate.return_value = {"c": "d"}
+        sam_translator.return_value = translate_mock
+        yaml_dump_patch.return_value = "c: d"
+
+        validator = SamTemplateValidator({"a": "b"}, Mock())
+
+        self.assertEqual(validator.get_translated_template_if_valid(), "c: d")
+        yaml_dump_patch.assert_called_once_with({"c": "d"})
+
     @patch("samcli.lib.translate.sam_template_validator.Session")
     @patch("samcli.lib.translate.sam_template_validator.Translator")
     @patch("samcli.lib.translate.sam_template_validator.parser")
@@ -58,16 +73,17 @@ class TestSamTemplateValidator(TestCase):
         boto_session_patch.return_value = boto_session_mock
 
         translate_mock = Mock()
-        translate_mock.translate.side_effect = InvalidDocumentException(
-            [InvalidResourceException("function", "this is the message")]
-        )
+        cause = InvalidResourceException("function", "this is the message")
+        translate_mock.translate.side_effect = InvalidDocumentException([cause])
         sam_translator.return_value = translate_mock
 
         validator = SamTemplateValidator(template, managed_policy_mock)
 
-        with self.assertRaises(InvalidSamDocumentException):
+        with self.assertRaises(InvalidSamDocumentException) as ex:
             validator.get_translated_template_if_valid()
 
+        self.assertEqual(str(ex.exception), str(translate_mock.translate.side_effect) + " " + str(cause))
+
         sam_translator.assert_called_once_with(
             managed_policy_map=None, sam_parser=parser, plugins=[], boto_session=boto_session_mock
         )
@@ -90,6 +106,40 @@ class TestSamTemplateValidator(TestCase):
         # check to see if SamParser was created
         self.assertIsNotNone(validator.sam_parser)
 
+    @patch("samcli.lib.translate.sam_template_validator.Session")
+    @patch("samcli.lib.translate.sam_template_validator.parser")
+    def test_init_defers_session_and_parser_creation(self, sam_parser, boto_session_patch):
+        validator = SamTemplateValidator({"a": "b"}, Mock(), profile="profile", region="region")
+
+        boto_session_patch.assert_not_called()
+        sam_parser.Parser.assert_not_called()
+
+        self.assertEqual(validator.boto3_session, boto_session_patch.return_value)
+        self.assertEqual(validator.boto3_session, boto_session_patch.return_value)
+        self.assertEqual(validator.sam_parser, sam_parser.Parser.return_value)
+
+        boto_session_patch.assert_called_once_with(profile_name="profile", region_name="region")
+        sam_parser.Parser.assert_called_once()
+
+    @patch("samcli.lib.translate.sam_template_validator.Session")
+    def test_init_reuses_given_session(self, boto_session_patch):
+        boto3_session = Mock()
+
+        validator = SamTemplateValidator({"a": "b"}, Mock(), boto3_session=boto3_session)
+
+        self.assertEqual(validator.boto3_session, boto3_session)
+        boto_session_patch.assert_not_called()
+
+    def test_get_managed_policy_map_loads_once(self):
+        managed_policy_mock = Mock()
+        managed_policy_mock.load.return_value = {"policy": "SomePolicy"}
+
+        validator = SamTemplateValidator({"a": "b"}, managed_policy_mock)
+
+        self.assertEqual(validator._get_managed_policy_map(), {"policy": "SomePolicy"})
+        self.assertEqual(validator._get_managed_policy_map(), {"policy": "SomePolicy"})
+        managed_policy_mock.load.assert_called_once_with()
+
     def test_uri_is_s3_uri(self):
         self.assertTrue(SamTemplateValidator.is_s3_uri("s3://bucket/key"))
 
@@ -105,6 +155,12 @@ class TestSamTemplateValidator(TestCase):
 
         self.assertEqual(property_value.get("CodeUri"), "s3://bucket/value")
 
+    def test_update_to_s3_uri_with_missing_property(self):
+        property_value = {}
+        SamTemplateValidator._update_to_s3_uri("CodeUri", property_value)
+
+        self.assertEqual(property_value.get("CodeUri"), "s3://bucket/value")
+
     def test_update_to_s3_url_with_dict(self):
         property_value = {"CodeUri": {"Bucket": "mybucket-name", "Key": "swagger", "Version": 121212}}
         SamTemplateValidator._update_to_s3_uri("CodeUri", property_value)
@@ -276,6 +332,32 @@ class TestSamTemplateValidator(TestCase):
             template_resources.get("ServerlessFunctionZip").get("Properties").get("CodeUri"), "s3://bucket/value"
         )
 
+    def test_replace_local_codeuri_when_no_function_globals_given(self):
+        template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Globals": {"Api": {"Cors": "'*'"}},
+            "Resources": {
+                "ServerlessFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"Handler": "index.handler", "CodeUri": "./", "Runtime": "nodejs6.10"},
+                },
+            },
+        }
+
+        managed_policy_mock = Mock()
+
+        validator = SamTemplateValidator(template, managed_policy_mock)
+
+        validator._replace_local_codeuri()
+
+        # check template
+        self.assertEqual(validator.sam_template.get("Globals"), {"Api": {"Cors": "'*'"}})
+        self.assertEqual(
+            validator.sam_template.get("Resources").get("ServerlessFunction").get("Properties").get("CodeUri"),
+            "s3://bucket/value",
+        )
+
     def test_DefinitionUri_does_not_get_added_to_template_when_DefinitionBody_given(self):
         template = {
             "AWSTemplateFormatVersion": "2010-09-09",
@@ -313,3 +395,92 @@ class TestSamTemplateValidator(TestCase):
 
         # check template
         self.assertEqual(validator.sam_template.get("Resources"), {})
+
+    def test_replace_local_image(self):
+        template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                "LocalImageFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"PackageType": IMAGE},
+                    "Metadata": {"Dockerfile": "Dockerfile"},
+                },
+                "RemoteImageFunction": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"PackageType": IMAGE, "ImageUri": "myimage:latest"},
+                    "Metadata": {"Dockerfile": "Dockerfile"},
+                },
+                "ImageFunctionWithoutMetadata": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"PackageType": IMAGE},
+                },
+            },
+        }
+
+        managed_policy_mock = Mock()
+
+        validator = SamTemplateValidator(template, managed_policy_mock)
+
+        validator._replace_local_codeuri()
+
+        # check template
+        template_resources = validator.sam_template.get("Resources")
+        self.assertEqual(
+            template_resources.get("LocalImageFunction").get("Properties").get("ImageUri"),
+            "111111111111.dkr.ecr.region.amazonaws.com/repository",
+        )
+        self.assertEqual(
+            template_resources.get("RemoteImageFunction").get("Properties").get("ImageUri"), "myimage:latest"
+        )
+        self.assertNotIn("ImageUri", template_resources.get("ImageFunctionWithoutMetadata").get("Properties"))
+        self.assertNotIn("CodeUri", template_resources.get("LocalImageFunction").get("Properties"))
+
+    def test_replace_local_codeuri_skips_resources_without_properties(self):
+        template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Globals": {"Function": {"CodeUri": "./"}},
+            "Resources": {
+                "ServerlessFunction": {"Type": "AWS::Serverless::Function"},
+                "ServerlessLayerVersion": {"Type": "AWS::Serverless::LayerVersion", "Properties": None},
+            },
+        }
+
+        managed_policy_mock = Mock()
+
+        validator = SamTemplateValidator(template, managed_policy_mock)
+
+        validator._replace_local_codeuri()
+
+        # check template
+        template_resources = validator.sam_template.get("Resources")
+        self.assertEqual(template_resources.get("ServerlessFunction"), {"Type": "AWS::Serverless::Function"})
+        self.assertIsNone(template_resources.get("ServerlessLayerVersion").get("Properties"))
+        self.assertEqual(validator.sam_template.get("Globals").get("Function").get("CodeUri"), "s3://bucket/value")
+
+    def test_replace_local_codeuri_skips_resources_with_invalid_type(self):
+        template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Transform": "AWS::Serverless-2016-10-31",
+            "Resources": {
+                "InvalidTypeResource": {
+                    "Type": {"AWS::Serverless::Function": "invalid_field"},
+                    "Properties": {"CodeUri": "./"},
+                },
+                "ServerlessLayerVersion": {"Type": "AWS::Serverless::LayerVersion", "Properties": {"ContentUri": "./"}},
+            },
+        }
+
+        managed_policy_mock = Mock()
+
+        validator = SamTemplateValidator(template, managed_policy_mock)
+
+        validator._replace_local_codeuri()
+
+        # check template
+        template_resources = validator.sam_template.get("Resources")
+        self.assertEqual(template_resources.get("InvalidTypeResource").get("Properties").get("CodeUri"), "./")
+        self.assertEqual(
+            template_resources.get("ServerlessLayerVersion").get("Properties").get("ContentUri"), "s3://bucket/value"
+        )
@@ -11,11 +11,14 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import json
+from unittest import TestCase, skipUnless
 
+import yaml
 from botocore.compat import OrderedDict
 
-from unittest import TestCase
-from samcli.yamlhelper import yaml_parse, yaml_dump
+from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
+
+from samcli.yamlhelper import CfnDumper, yaml_parse, yaml_dump
 
 
 class TestYaml(TestCase):
@@ -183,3 +186,20 @@ class TestYaml(TestCase):
         # Raises a `TypeError` if an unquoted `AWSTemplateFormatVersion` value has been parsed to a
         # `datetime` object and not a string by `yaml_parse` when using `--use-json` argument.
         json.dumps(output)
+
+    @skipUnless(yaml.__with_libyaml__, "PyYAML is not built with libyaml")
+    def test_libyaml_dumper_is_used_when_available(self):
+        self.assertTrue(issubclass(CfnDumper, yaml.CSafeDumper))
+
+    def test_yaml_dumps_py27_types(self):
+        input_yaml_dict = Py27Dict()
+        input_yaml_dict[Py27UniStr("Resource")] = {Py27UniStr("Key"): Py27UniStr("value")}
+
+        self.assertEqual(yaml_dump(input_yaml_dict), "Resource:\n  Key: value\n")
+
+    def test_parse_error_keeps_source_excerpt(self):
+        with self.assertRaises(yaml.YAMLError) as ex:
+            yaml_parse("Resources:\n  Key: {%- if foo %}\n")
+
+        self.assertIn("found character '%' that cannot start any token", str(ex.exception))
+        self.assertIn("^", str(ex.exception))